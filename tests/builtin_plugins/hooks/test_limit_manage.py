@@ -0,0 +1,69 @@
+from nonebot.exception import IgnoredException
+from nonebug import App
+import pytest
+from pytest_mock import MockerFixture
+
+from tests.config import GroupId, UserId
+
+
+def init_limits(module: str):
+    """注册同时带有 CD 与 BLOCK 限制的模块"""
+    from zhenxun.builtin_plugins.hooks._auth_checker import LimitManage
+    from zhenxun.models.plugin_limit import PluginLimit
+    from zhenxun.utils.enum import LimitWatchType, PluginLimitType
+
+    LimitManage.module2limit.pop(module, None)
+    for limit_type in (PluginLimitType.CD, PluginLimitType.BLOCK):
+        LimitManage.add_limit(
+            PluginLimit(
+                module=module,
+                module_path=module,
+                limit_type=limit_type,
+                watch_type=LimitWatchType.USER,
+                cd=60,
+            )
+        )
+    return LimitManage, LimitManage.module2limit[module]
+
+
+async def test_limit_cd_and_block(app: App, mocker: MockerFixture) -> None:
+    """
+    测试CD与BLOCK限制同时存在时均生效
+    """
+    from zhenxun.utils.enum import PluginLimitType
+
+    limit_manage, limits = init_limits("test_cd_and_block")
+    user_id = str(UserId.USER_LEVEL_0)
+    group_id = str(GroupId.GROUP_ID_LEVEL_5)
+    session = mocker.MagicMock()
+
+    await limit_manage.check("test_cd_and_block", user_id, group_id, None, session)
+    assert not limits[PluginLimitType.CD].limiter.check(user_id)
+    assert not limits[PluginLimitType.BLOCK].limiter.check(user_id)
+
+    limit_manage.unblock("test_cd_and_block", user_id, group_id, None)
+    assert limits[PluginLimitType.BLOCK].limiter.check(user_id)
+    with pytest.raises(IgnoredException):
+        await limit_manage.check("test_cd_and_block", user_id, group_id, None, session)
+    assert limits[PluginLimitType.BLOCK].limiter.check(user_id)
+
+
+async def test_limit_block_reject_not_start_cd(app: App, mocker: MockerFixture) -> None:
+    """
+    测试BLOCK限制拦截时不会开始CD限制
+    """
+    from zhenxun.utils.enum import PluginLimitType
+
+    limit_manage, limits = init_limits("test_block_reject")
+    user_id = str(UserId.USER_LEVEL_0)
+    group_id = str(GroupId.GROUP_ID_LEVEL_5)
+    session = mocker.MagicMock()
+
+    limits[PluginLimitType.BLOCK].limiter.set_true(user_id)  # type: ignore
+    with pytest.raises(IgnoredException):
+        await limit_manage.check("test_block_reject", user_id, group_id, None, session)
+    assert limits[PluginLimitType.CD].limiter.check(user_id)
+
+    limit_manage.unblock("test_block_reject", user_id, group_id, None)
+    await limit_manage.check("test_block_reject", user_id, group_id, None, session)
+    assert not limits[PluginLimitType.CD].limiter.check(user_id)
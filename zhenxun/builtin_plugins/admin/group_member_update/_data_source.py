@@ -10,32 +10,32 @@ from zhenxun.models.level_user import LevelUser
 from zhenxun.services.log import logger
 from zhenxun.utils.platform import PlatformUtils
 
+driver = nonebot.get_driver()
+
 
 class MemberUpdateManage:
     @classmethod
     async def __handle_user(
         cls,
         member: Member,
-        db_user: list[GroupInfoUser],
+        uid2user: dict[str, list[GroupInfoUser]],
         group_id: str,
         data_list: tuple[list, list, list],
         platform: str | None,
+        default_auth: int | None,
     ):
         """单个成员操作
 
         参数:
             member: Member
-            db_user: db成员数据
+            uid2user: 用户id与db成员数据映射
             group_id: 群组id
             data_list: 数据列表
             platform: 平台
+            default_auth: 群管理员默认权限
         """
-        driver = nonebot.get_driver()
-        default_auth = Config.get_config("admin_bot_manage", "ADMIN_DEFAULT_AUTH")
         nickname = member.nick or member.user.name or ""
         role = member.role
-        db_user_uid = [u.user_id for u in db_user]
-        uid2name = {u.user_id: u.user_name for u in db_user}
         if member.id in driver.config.superusers:
             await LevelUser.set_level(member.id, group_id, 9)
         elif role and default_auth:
@@ -46,13 +46,12 @@ class MemberUpdateManage:
                     await LevelUser.set_level(member.id, group_id, default_auth + 1)
                 elif role.id == "ADMINISTRATOR":
                     await LevelUser.set_level(member.id, group_id, default_auth)
-        if cnt := db_user_uid.count(member.id):
-            users = [u for u in db_user if u.user_id == member.id]
-            if cnt > 1:
+        if users := uid2user.get(member.id):
+            if len(users) > 1:
                 for u in users[1:]:
                     data_list[2].append(u.id)
-            if nickname != uid2name.get(member.id):
-                user = users[0]
+            user = users[0]
+            if nickname != user.user_name:
                 user.user_name = nickname
                 data_list[1].append(user)
         else:
@@ -92,13 +91,18 @@ class MemberUpdateManage:
                 return "更新群组失败，群组不存在..."
             members = await interface.get_members(SceneType.GROUP, group_list[0].id)
             db_user = await GroupInfoUser.filter(group_id=group_id).all()
-            db_user_uid = [u.user_id for u in db_user]
+            uid2user: dict[str, list[GroupInfoUser]] = {}
+            for u in db_user:
+                uid2user.setdefault(u.user_id, []).append(u)
             data_list = ([], [], [])
-            exist_member_list = []
+            exist_member_list = set()
+            default_auth = Config.get_config("admin_bot_manage", "ADMIN_DEFAULT_AUTH")
             for member in members:
-                logger.debug(f"即将更新群组成员: {member}", "更新群组成员信息")
-                await cls.__handle_user(member, db_user, group_id, data_list, platform)
-                exist_member_list.append(member.id)
+                logger.debug("即将更新群组成员", "更新群组成员信息", target=member)
+                await cls.__handle_user(
+                    member, uid2user, group_id, data_list, platform, default_auth
+                )
+                exist_member_list.add(member.id)
             if data_list[0]:
                 try:
                     await GroupInfoUser.bulk_create(data_list[0], 30)
@@ -132,7 +136,7 @@ class MemberUpdateManage:
                 logger.debug(f"删除重复数据 Ids: {data_list[2]}", "更新群组成员信息")
 
             if delete_member_list := [
-                uid for uid in db_user_uid if uid not in exist_member_list
+                uid for uid in uid2user if uid not in exist_member_list
             ]:
                 await GroupInfoUser.filter(
                     user_id__in=delete_member_list, group_id=group_id
@@ -125,22 +125,22 @@ async def _(
     ):
         idx = 1
         data_list = []
+        uid2name = dict(
+            await GroupInfoUser.filter(
+                user_id__in=[uid for uid, _ in rank_data], group_id=group_id
+            ).values_list("user_id", "user_name")
+        )
 
         for uid, num in rank_data:
             if len(data_list) >= count.result:
                 break
 
-            user_in_group = await GroupInfoUser.filter(
-                user_id=uid, group_id=group_id
-            ).first()
-
-            if not user_in_group and not show_quit_member:
-                continue
-
-            if user_in_group:
-                user_name = user_in_group.user_name
-            else:
+            if uid in uid2name:
+                user_name = uid2name[uid]
+            elif show_quit_member:
                 user_name = f"{uid}(已退群)"
+            else:
+                continue
 
             avatar_size = 40
             try:
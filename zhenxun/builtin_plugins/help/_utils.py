@@ -1,3 +1,4 @@
+from collections import defaultdict
 from collections.abc import Callable
 
 from nonebot_plugin_uninfo import Uninfo
@@ -18,15 +19,13 @@ async def sort_type() -> dict[str, list[PluginInfo]]:
         plugin_type__in=[PluginType.NORMAL, PluginType.DEPENDANT],
         is_show=True,
     )
-    sort_data = {}
+    sort_data: dict[str, list[PluginInfo]] = defaultdict(list)
     for plugin in data:
         menu_type = plugin.menu_type or "normal"
         if menu_type == "normal":
             menu_type = "功能"
-        if not sort_data.get(menu_type):
-            sort_data[menu_type] = []
         sort_data[menu_type].append(plugin)
-    return sort_data
+    return dict(sort_data)
 
 
 async def classify_plugin(
@@ -44,12 +43,9 @@ async def classify_plugin(
         dict[str, list[Item]]: 分类插件数据
     """
     sort_data = await sort_type()
-    classify: dict[str, list] = {}
     group = await GroupConsole.get_or_none(group_id=group_id) if group_id else None
     bot = await BotConsole.get_or_none(bot_id=session.self_id)
-    for menu, value in sort_data.items():
-        for plugin in value:
-            if not classify.get(menu):
-                classify[menu] = []
-            classify[menu].append(handle(bot, plugin, group, is_detail))
-    return classify
+    return {
+        menu: [handle(bot, plugin, group, is_detail) for plugin in value]
+        for menu, value in sort_data.items()
+    }
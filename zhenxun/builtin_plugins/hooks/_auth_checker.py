@@ -1,4 +1,7 @@
-from typing import ClassVar
+from collections.abc import Callable
+from dataclasses import dataclass
+import time
+from typing import Any, ClassVar
 
 from nonebot.adapters import Bot, Event
 from nonebot.adapters.onebot.v11 import PokeNotifyEvent
@@ -6,7 +9,6 @@ from nonebot.exception import IgnoredException
 from nonebot.matcher import Matcher
 from nonebot_plugin_alconna import At, UniMsg
 from nonebot_plugin_session import EventSession
-from pydantic import BaseModel
 from tortoise.exceptions import IntegrityError
 
 from zhenxun.configs.config import Config
@@ -32,20 +34,52 @@ from zhenxun.utils.utils import CountLimiter, FreqLimiter, UserBlockLimiter
 base_config = Config.get("hook")
 
 
-class Limit(BaseModel):
+@dataclass(slots=True)
+class Limit:
     limit: PluginLimit
     limiter: FreqLimiter | UserBlockLimiter | CountLimiter
-
-    class Config:
-        arbitrary_types_allowed = True
+    start: Callable[[Any], Any]
+    """开始限制方法，注册时按限制器类型绑定"""
 
 
 class LimitManage:
-    add_module: ClassVar[list] = []
+    CHECK_ORDER: ClassVar[tuple[PluginLimitType, ...]] = (
+        PluginLimitType.CD,
+        PluginLimitType.BLOCK,
+        PluginLimitType.COUNT,
+    )
+    """限制检测顺序"""
+
+    module2limit: ClassVar[dict[str, dict[PluginLimitType, Limit]]] = {}
+    """模块名与各类型限制映射"""
+
+    EMPTY_TTL: ClassVar[int] = 30
+    """无限制模块的查询结果缓存时长（秒）"""
 
-    cd_limit: ClassVar[dict[str, Limit]] = {}
-    block_limit: ClassVar[dict[str, Limit]] = {}
-    count_limit: ClassVar[dict[str, Limit]] = {}
+    module2empty_time: ClassVar[dict[str, float]] = {}
+    """无限制模块与最后查询时间"""
+
+    @classmethod
+    async def load_limit(cls, plugin: PluginInfo):
+        """从数据库加载插件限制，无限制的模块在 EMPTY_TTL 内不再重复查询
+
+        参数:
+            plugin: PluginInfo
+        """
+        module = plugin.module
+        if module in cls.module2limit:
+            return
+        if time.time() - cls.module2empty_time.get(module, 0) < cls.EMPTY_TTL:
+            return
+        limit_list: list[PluginLimit] = await plugin.plugin_limit.filter(
+            status=True
+        ).all()  # type: ignore
+        for limit in limit_list:
+            cls.add_limit(limit)
+        if module in cls.module2limit:
+            cls.module2empty_time.pop(module, None)
+        else:
+            cls.module2empty_time[module] = time.time()
 
     @classmethod
     def add_limit(cls, limit: PluginLimit):
@@ -54,20 +88,21 @@ class LimitManage:
         参数:
             limit: PluginLimit
         """
-        if limit.module not in cls.add_module:
-            cls.add_module.append(limit.module)
-            if limit.limit_type == PluginLimitType.BLOCK:
-                cls.block_limit[limit.module] = Limit(
-                    limit=limit, limiter=UserBlockLimiter()
-                )
-            elif limit.limit_type == PluginLimitType.CD:
-                cls.cd_limit[limit.module] = Limit(
-                    limit=limit, limiter=FreqLimiter(limit.cd)
-                )
-            elif limit.limit_type == PluginLimitType.COUNT:
-                cls.count_limit[limit.module] = Limit(
-                    limit=limit, limiter=CountLimiter(limit.max_count)
-                )
+        limits = cls.module2limit.setdefault(limit.module, {})
+        if limit.limit_type in limits:
+            return
+        if limit.limit_type == PluginLimitType.BLOCK:
+            limiter = UserBlockLimiter()
+            start = limiter.set_true
+        elif limit.limit_type == PluginLimitType.CD:
+            limiter = FreqLimiter(limit.cd)
+            start = limiter.start_cd
+        elif limit.limit_type == PluginLimitType.COUNT:
+            limiter = CountLimiter(limit.max_count)
+            start = limiter.increase
+        else:
+            return
+        limits[limit.limit_type] = Limit(limit=limit, limiter=limiter, start=start)
 
     @classmethod
     def unblock(
@@ -81,7 +116,8 @@ class LimitManage:
             group_id: 群组id
             channel_id: 频道id
         """
-        if limit_model := cls.block_limit.get(module):
+        limits = cls.module2limit.get(module)
+        if limits and (limit_model := limits.get(PluginLimitType.BLOCK)):
             limit = limit_model.limit
             limiter: UserBlockLimiter = limit_model.limiter  # type: ignore
             key_type = user_id
@@ -116,22 +152,35 @@ class LimitManage:
         异常:
             IgnoredException: IgnoredException
         """
-        if limit_model := cls.cd_limit.get(module):
-            await cls.__check(limit_model, user_id, group_id, channel_id, session)
-        if limit_model := cls.block_limit.get(module):
-            await cls.__check(limit_model, user_id, group_id, channel_id, session)
-        if limit_model := cls.count_limit.get(module):
-            await cls.__check(limit_model, user_id, group_id, channel_id, session)
+        if not (limits := cls.module2limit.get(module)):
+            return
+        passed: list[tuple[Limit, str]] = []
+        for limit_type in cls.CHECK_ORDER:
+            if limit_model := limits.get(limit_type):
+                key_type = await cls.__check(
+                    limit_model, user_id, group_id, channel_id, session
+                )
+                passed.append((limit_model, key_type))
+        # 全部限制检测通过后再开始限制，避免被后续限制拦截时前面的限制已生效
+        for limit_model, key_type in passed:
+            logger.debug(
+                f"开始进行限制 {limit_model.limit.module}"
+                f"({limit_model.limit.limit_type})...",
+                "AuthChecker",
+                session=user_id,
+                group_id=group_id,
+            )
+            limit_model.start(key_type)
 
     @classmethod
     async def __check(
         cls,
-        limit_model: Limit | None,
+        limit_model: Limit,
         user_id: str,
         group_id: str | None,
         channel_id: str | None,
         session: EventSession,
-    ):
+    ) -> str:
         """检测限制
 
         参数:
@@ -143,9 +192,10 @@ class LimitManage:
 
         异常:
             IgnoredException: IgnoredException
+
+        返回:
+            str: 限制对象key
         """
-        if not limit_model:
-            return
         limit = limit_model.limit
         limiter = limit_model.limiter
         is_limit = (
@@ -165,19 +215,7 @@ class LimitManage:
                 session=session,
             )
             raise IgnoredException(f"{limit.module} 正在限制中...")
-        else:
-            logger.debug(
-                f"开始进行限制 {limit.module}({limit.limit_type})...",
-                "AuthChecker",
-                session=user_id,
-                group_id=group_id,
-            )
-            if isinstance(limiter, FreqLimiter):
-                limiter.start_cd(key_type)
-            if isinstance(limiter, UserBlockLimiter):
-                limiter.set_true(key_type)
-            if isinstance(limiter, CountLimiter):
-                limiter.increase(key_type)
+        return key_type
 
 
 class IsSuperuserException(Exception):
@@ -335,12 +373,7 @@ class AuthChecker:
         if not group_id:
             group_id = channel_id
             channel_id = None
-        if plugin.module not in LimitManage.add_module:
-            limit_list: list[PluginLimit] = await plugin.plugin_limit.filter(
-                status=True
-            ).all()  # type: ignore
-            for limit in limit_list:
-                LimitManage.add_limit(limit)
+        await LimitManage.load_limit(plugin)
         if user_id:
             await LimitManage.check(
                 plugin.module, user_id, group_id, channel_id, session
@@ -76,7 +76,7 @@ async def handle_api_result(
             else replace_message(message),
             platform=PlatformUtils.get_platform(bot),
         )
-        logger.debug(f"消息发送记录，message: {message}")
+        logger.debug("消息发送记录", "msg_hook", target=message)
     except Exception as e:
         logger.warning(
             f"消息发送记录发生错误...data: {data}, result: {result}",
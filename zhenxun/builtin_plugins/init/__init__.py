@@ -12,6 +12,9 @@ nonebot.load_plugins(str(Path(__file__).parent.resolve()))
 
 driver = nonebot.get_driver()
 
+IN_QUERY_CHUNK_SIZE = 500
+"""单次 IN 查询的最大参数数量，避免超出 SQLite 变量数限制"""
+
 
 @driver.on_bot_connect
 async def _(bot: Bot):
@@ -24,7 +27,7 @@ async def _(bot: Bot):
         return
     logger.debug(f"更新Bot: {bot.self_id} 的群认证...")
     group_list, _ = await PlatformUtils.get_group_list(bot)
-    db_group_list = await GroupConsole.all().values_list("group_id", flat=True)
+    db_group_list = set(await GroupConsole.all().values_list("group_id", flat=True))
     create_list = []
     update_id = []
     for group in group_list:
@@ -35,8 +38,10 @@ async def _(bot: Bot):
             update_id.append(group.group_id)
     if create_list:
         await GroupConsole.bulk_create(create_list, 10)
-    else:
-        await GroupConsole.filter(group_id__in=update_id).update(group_flag=1)
+    for i in range(0, len(update_id), IN_QUERY_CHUNK_SIZE):
+        await GroupConsole.filter(
+            group_id__in=update_id[i : i + IN_QUERY_CHUNK_SIZE]
+        ).update(group_flag=1)
     logger.debug(
         f"更新Bot: {bot.self_id} 的群认证完成，共创建 {len(create_list)} 条数据，"
         f"共修改 {len(update_id)} 条数据..."
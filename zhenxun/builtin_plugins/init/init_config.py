@@ -26,7 +26,7 @@ if old_config_file.exists():
     old_config_file.rename(SIMPLE_CONFIG_FILE)
 
 
-def _handle_config(plugin: Plugin, exists_module: list[str]):
+def _handle_config(plugin: Plugin, exists_module: set[str]):
     """处理配置项
 
     参数:
@@ -50,10 +50,10 @@ def _handle_config(plugin: Plugin, exists_module: list[str]):
                     arg_parser=reg_config.arg_parser,
                     _override=False,
                 )
-                exists_module.append(f"{module}:{reg_config.key}".lower())
+                exists_module.add(f"{module}:{reg_config.key}".lower())
 
 
-def _generate_simple_config(exists_module: list[str]):
+def _generate_simple_config(exists_module: set[str]):
     """
     生成简易配置
 
@@ -63,7 +63,7 @@ def _generate_simple_config(exists_module: list[str]):
     # 读取用户配置
     _data = {}
     _tmp_data = {}
-    exists_module += Config.add_module
+    exists_module.update(Config.add_module)
     if SIMPLE_CONFIG_FILE.exists():
         _data = _yaml.load(SIMPLE_CONFIG_FILE.open(encoding="utf8"))
     # 将简易配置文件的数据填充到配置文件
@@ -109,7 +109,7 @@ def _():
     初始化插件数据配置
     """
     plugins2config_file = DATA_PATH / "configs" / "plugins2config.yaml"
-    exists_module = []
+    exists_module = set()
     for plugin in get_loaded_plugins():
         if plugin.metadata:
             _handle_config(plugin, exists_module)
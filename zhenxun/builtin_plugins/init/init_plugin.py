@@ -1,3 +1,5 @@
+from collections import defaultdict
+
 import aiofiles
 import nonebot
 from nonebot import get_loaded_plugins
@@ -182,36 +184,30 @@ async def limit_migration():
     cd_file = DATA_PATH / "configs" / "plugins2cd.yaml"
     block_file = DATA_PATH / "configs" / "plugins2block.yaml"
     count_file = DATA_PATH / "configs" / "plugins2count.yaml"
-    limit_data: dict[str, list[tuple[str, dict]]] = {}
+    limit_data: dict[str, list[tuple[str, dict]]] = defaultdict(list)
     if cd_file.exists():
         async with aiofiles.open(cd_file, encoding="utf8") as f:
             if data := _yaml.load(await f.read()):
                 for k in data["PluginCdLimit"]:
-                    limit_data[k] = [("CD", data["PluginCdLimit"][k])]
+                    limit_data[k].append(("CD", data["PluginCdLimit"][k]))
         cd_file.unlink()
     if block_file.exists():
         async with aiofiles.open(block_file, encoding="utf8") as f:
             if data := _yaml.load(await f.read()):
                 for k in data["PluginBlockLimit"]:
-                    if k in limit_data:
-                        limit_data[k].append(("BLOCK", data["PluginBlockLimit"][k]))
-                    else:
-                        limit_data[k] = [("BLOCK", data["PluginBlockLimit"][k])]
+                    limit_data[k].append(("BLOCK", data["PluginBlockLimit"][k]))
         block_file.unlink()
     if count_file.exists():
         async with aiofiles.open(count_file, encoding="utf8") as f:
             if data := _yaml.load(await f.read()):
                 for k in data["PluginCountLimit"]:
-                    if k in limit_data:
-                        limit_data[k].append(("COUNT", data["PluginCountLimit"][k]))
-                    else:
-                        limit_data[k] = [("COUNT", data["PluginCountLimit"][k])]
+                    limit_data[k].append(("COUNT", data["PluginCountLimit"][k]))
         count_file.unlink()
     if limit_data:
         logger.info("开始迁移插件限制数据...")
         update_list = []
         create_list = []
-        plugins = await PluginInfo.filter(module__in=limit_data.keys())
+        plugins = await PluginInfo.filter(module__in=list(limit_data))
         for plugin in plugins:
             limits: list[PluginLimit] = await plugin.plugin_limit.all()  # type: ignore
             exits_limit = [x[0] for x in limit_data[plugin.module]]
@@ -305,12 +301,9 @@ async def plugin_migration():
             if data := _yaml.load(await f.read()):
                 logger.info("开始迁移插件setting数据...")
                 data = data["PluginSettings"]
-                plugins = await PluginInfo.filter(module__in=data.keys())
+                plugins = await PluginInfo.filter(module__in=list(data))
                 for plugin in plugins:
-                    if plugin_data_list := [
-                        data[p] for p in data if p == plugin.module
-                    ]:
-                        plugin_data = plugin_data_list[0]
+                    if (plugin_data := data.get(plugin.module)) is not None:
                         plugin.default_status = plugin_data.get("default_status", True)
                         plugin.level = plugin_data.get("level", 5)
                         plugin.limit_superuser = plugin_data.get(
@@ -335,7 +328,7 @@ async def plugin_migration():
         async with aiofiles.open(plugin_file, encoding="utf8") as f:
             if data := json.loads(await f.read()):
                 logger.info("开始迁移插件数据...")
-                plugins = await PluginInfo.filter(module__in=data.keys())
+                plugins = await PluginInfo.filter(module__in=list(data))
                 for plugin in plugins:
                     if plugin_data := data.get(plugin.module):
                         plugin.status = plugin_data.get("status", True)
@@ -372,9 +365,12 @@ async def group_migration():
                 if close_task := data["close_task"]:
                     """全局被动关闭"""
                     await TaskInfo.filter(module__in=close_task).update(status=False)
-                group_list = await GroupConsole.filter(
-                    group_id__in=old_group_list.keys()
-                )
+                group_dict = {
+                    g.group_id: g
+                    for g in await GroupConsole.filter(
+                        group_id__in=list(old_group_list)
+                    )
+                }
                 for old_group_id, old_group in old_group_list.items():
                     block_plugin = ""
                     block_task = ""
@@ -387,8 +383,7 @@ async def group_migration():
                             t for t in group_task_status if not group_task_status[t]
                         ]
                         block_task = ",".join(close_task) + ","
-                    if group_ := [g for g in group_list if g.group_id == old_group_id]:
-                        group = group_[0]
+                    if group := group_dict.get(old_group_id):
                         if group.group_id in white_group:
                             group.is_super = True
                         group.status = status
@@ -1,3 +1,5 @@
+from functools import cache
+
 import nonebot
 from nonebot import get_loaded_plugins
 from nonebot.drivers import Driver
@@ -14,6 +16,9 @@ from zhenxun.utils.manager.priority_manager import PriorityLifecycle
 
 driver: Driver = nonebot.get_driver()
 
+_is_coroutine_callable = cache(is_coroutine_callable)
+"""按函数缓存的协程判断，定时任务每次运行时无需重复检查"""
+
 
 async def _handle_setting(
     plugin: Plugin,
@@ -94,7 +99,7 @@ async def to_db(
 async def get_run_task(task: Task, *args, **kwargs):
     is_run = False
     if task.check:
-        if is_coroutine_callable(task.check):
+        if _is_coroutine_callable(task.check):
             if await task.check(*task.check_args):
                 is_run = True
         elif task.check(*task.check_args):
@@ -105,7 +110,7 @@ async def get_run_task(task: Task, *args, **kwargs):
         if not await CommonUtils.task_is_block(bot, task.module, group_id):
             is_run = True
     if is_run and task.run_func:
-        if is_coroutine_callable(task.run_func):
+        if _is_coroutine_callable(task.run_func):
             await task.run_func(*args, **kwargs)
         else:
             task.run_func(*args, **kwargs)
@@ -3,10 +3,11 @@ from datetime import datetime, timedelta
 import nonebot
 from nonebot_plugin_apscheduler import scheduler
 import pytz
+from tortoise.functions import Max
 
 from zhenxun.configs.config import Config
 from zhenxun.models.chat_history import ChatHistory
-from zhenxun.models.group_console import GroupConsole
+from zhenxun.models.group_console import GroupConsole, convert_module_format
 from zhenxun.models.task_info import TaskInfo
 from zhenxun.services.log import logger
 from zhenxun.utils.platform import PlatformUtils
@@ -36,30 +37,38 @@ async def _():
     """检测群组发言时间并禁用全部被动"""
     update_list = []
     if modules := await TaskInfo.annotate().values_list("module", flat=True):
+        block_task = convert_module_format(modules)
+        now = datetime.now(pytz.timezone("Asia/Shanghai"))
         for bot in nonebot.get_bots().values():
             group_list, _ = await PlatformUtils.get_group_list(bot, True)
+            if not group_list:
+                continue
+            try:
+                group2time = dict(
+                    await ChatHistory.filter(
+                        group_id__in=[group.group_id for group in group_list]
+                    )
+                    .annotate(last_time=Max("create_time"))
+                    .group_by("group_id")
+                    .values_list("group_id", "last_time")
+                )
+            except Exception as e:
+                logger.error("获取群组最后发言时间失败...", "Chat检测", e=e)
+                continue
             for group in group_list:
                 try:
-                    last_message = (
-                        await ChatHistory.filter(group_id=group.group_id)
-                        .annotate()
-                        .order_by("-create_time")
-                        .first()
-                    )
-                    if last_message:
-                        now = datetime.now(pytz.timezone("Asia/Shanghai"))
-                        if now - timedelta(days=2) > last_message.create_time:
-                            _group, _ = await GroupConsole.get_or_create(
-                                group_id=group.group_id, channel_id__isnull=True
-                            )
-                            modules = [f"<{module}" for module in modules]
-                            _group.block_task = ",".join(modules) + ","  # type: ignore
-                            update_list.append(_group)
-                            logger.info(
-                                "群组两日内未发送任何消息，关闭该群全部被动",
-                                "Chat检测",
-                                target=_group.group_id,
-                            )
+                    last_time = group2time.get(group.group_id)
+                    if last_time and now - timedelta(days=2) > last_time:
+                        _group, _ = await GroupConsole.get_or_create(
+                            group_id=group.group_id, channel_id__isnull=True
+                        )
+                        _group.block_task = block_task
+                        update_list.append(_group)
+                        logger.info(
+                            "群组两日内未发送任何消息，关闭该群全部被动",
+                            "Chat检测",
+                            target=_group.group_id,
+                        )
                 except Exception:
                     logger.error(
                         "检测群组发言时间失败...", "Chat检测", target=group.group_id
@@ -1,6 +1,8 @@
 import asyncio
 from collections.abc import Callable
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
+from functools import cache
 import inspect
 import time
 from types import MappingProxyType
@@ -29,12 +31,26 @@ from .html_image import html_image
 from .normal_image import normal_image
 
 
-class Goods(BaseModel):
+@cache
+def _func_meta(func: Callable) -> tuple[MappingProxyType, bool]:
+    """获取函数参数及是否为协程函数，按函数缓存避免每次使用时重复反射
+
+    参数:
+        func: 函数
+
+    返回:
+        tuple[MappingProxyType, bool]: 函数参数, 是否为协程函数
+    """
+    return inspect.signature(func).parameters, asyncio.iscoroutinefunction(func)
+
+
+@dataclass(slots=True)
+class Goods:
     name: str
     """商品名称"""
-    before_handle: list[Callable] = Field(default_factory=list)
+    before_handle: list[Callable] = field(default_factory=list)
     """使用前函数"""
-    after_handle: list[Callable] = Field(default_factory=list)
+    after_handle: list[Callable] = field(default_factory=list)
     """使用后函数"""
     func: Callable | None = None
     """使用函数"""
@@ -50,7 +66,7 @@ class Goods(BaseModel):
     """Uninfo"""
     at_user: str | None = None
     """At对象"""
-    at_users: list[str] = []
+    at_users: list[str] = field(default_factory=list)
     """At对象列表"""
 
 
@@ -123,10 +139,13 @@ async def gold_rank(
     column_name = ["排名", "-", "名称", "金币", "平台"]
     data_list = []
     platform = PlatformUtils.get_platform(session)
-    for i, user in enumerate(user_list):
-        ava_bytes = await PlatformUtils.get_user_avatar(
-            user[0], platform, session.self_id
-        )
+    ava_list = await asyncio.gather(
+        *[
+            PlatformUtils.get_user_avatar(user[0], platform, session.self_id)
+            for user in user_list
+        ]
+    )
+    for i, (user, ava_bytes) in enumerate(zip(user_list, ava_list)):
         data_list.append(
             [
                 f"{i + 1}",
@@ -263,21 +282,17 @@ class ShopManage:
             run_type: 运行类型
         """
         fun_list = goods.before_handle if run_type == "before" else goods.after_handle
-        if fun_list:
-            for func in fun_list:
-                if args := inspect.signature(func).parameters:
-                    if asyncio.iscoroutinefunction(func):
-                        await func(
-                            **cls.__parse_args(args, param, session, message, **kwargs)
-                        )
-                    else:
-                        func(
-                            **cls.__parse_args(args, param, session, message, **kwargs)
-                        )
-                elif asyncio.iscoroutinefunction(func):
-                    await func()
-                else:
-                    func()
+        for func in fun_list:
+            args, is_coroutine = _func_meta(func)
+            _kwargs = (
+                cls.__parse_args(args, param, session, message, **kwargs)
+                if args
+                else {}
+            )
+            if is_coroutine:
+                await func(**_kwargs)
+            else:
+                func(**_kwargs)
 
     @classmethod
     async def __run(
@@ -297,22 +312,15 @@ class ShopManage:
         返回:
             str | MessageFactory | None: 使用完成后返回信息
         """
-        args = inspect.signature(goods.func).parameters  # type: ignore
-        if goods.func:
-            if args:
-                return (
-                    await goods.func(
-                        **cls.__parse_args(args, param, session, message, **kwargs)
-                    )
-                    if asyncio.iscoroutinefunction(goods.func)
-                    else goods.func(
-                        **cls.__parse_args(args, param, session, message, **kwargs)
-                    )
-                )
-            if asyncio.iscoroutinefunction(goods.func):
-                return await goods.func()
-            else:
-                return goods.func()
+        if not goods.func:
+            return None
+        args, is_coroutine = _func_meta(goods.func)
+        _kwargs = (
+            cls.__parse_args(args, param, session, message, **kwargs) if args else {}
+        )
+        if is_coroutine:
+            return await goods.func(**_kwargs)
+        return goods.func(**_kwargs)
 
     @classmethod
     async def use(
@@ -499,7 +507,7 @@ class ShopManage:
         if not user.props:
             return None
 
-        goods_list = await GoodsInfo.filter(uuid__in=user.props.keys()).all()
+        goods_list = await GoodsInfo.filter(uuid__in=list(user.props)).all()
         goods_by_uuid = {item.uuid: item for item in goods_list}
         user.props = {
             uuid: count
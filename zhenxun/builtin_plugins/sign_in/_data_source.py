@@ -1,3 +1,4 @@
+import asyncio
 from datetime import datetime
 from pathlib import Path
 import random
@@ -77,10 +78,13 @@ class SignManage:
                 uid2name[g[0]] = g[1]
         data_list = []
         platform = PlatformUtils.get_platform(session)
-        for i, user in enumerate(user_list):
-            bytes = await PlatformUtils.get_user_avatar(
-                user[0], platform, session.self_id
-            )
+        ava_list = await asyncio.gather(
+            *[
+                PlatformUtils.get_user_avatar(user[0], platform, session.self_id)
+                for user in user_list
+            ]
+        )
+        for i, (user, bytes) in enumerate(zip(user_list, ava_list)):
             data_list.append(
                 [
                     f"{i + 1}",
@@ -123,7 +123,7 @@ class StatisticsManage:
     async def __build_image(cls, data_list: list[tuple[str, int]], title: str):
         module2count = {x[0]: x[1] for x in data_list}
         plugin_info = await PluginInfo.filter(
-            module__in=module2count.keys(),
+            module__in=list(module2count),
             load_status=True,
             plugin_type=PluginType.NORMAL,
         ).all()
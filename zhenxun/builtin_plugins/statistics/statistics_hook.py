@@ -55,9 +55,9 @@ async def _(
 
 @scheduler.scheduled_job("interval", minutes=1, max_instances=5)
 async def _():
+    global TEMP_LIST
     try:
-        call_list = TEMP_LIST.copy()
-        TEMP_LIST.clear()
+        call_list, TEMP_LIST = TEMP_LIST, []
         if call_list:
             await Statistics.bulk_create(call_list)
         logger.debug(f"批量添加调用记录 {len(call_list)} 条", "定时任务")
@@ -256,13 +256,14 @@ class ApiDataSource:
             .order_by("-id")
             .offset((query.index - 1) * query.size)
             .limit(query.size)
+            .values_list("bot_id", "connect_time", "type")
         )
-        result_list = []
-        for v in data:
-            v.connect_time = v.connect_time.replace(tzinfo=None).replace(microsecond=0)
-            result_list.append(
-                BotConnectLogInfo(
-                    bot_id=v.bot_id, connect_time=v.connect_time, type=v.type
-                )
+        result_list = [
+            BotConnectLogInfo(
+                bot_id=bot_id,
+                connect_time=connect_time.replace(tzinfo=None, microsecond=0),
+                type=type_,
             )
+            for bot_id, connect_time, type_ in data
+        ]
         return BaseResultModel(total=total, data=result_list)
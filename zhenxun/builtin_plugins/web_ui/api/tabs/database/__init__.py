@@ -125,8 +125,9 @@ async def _(query: QueryModel) -> Result[BaseResultModel]:
             .order_by("-id")
             .offset((query.index - 1) * query.size)
             .limit(query.size)
+            .values_list("sql", flat=True)
         )
-        result_list = [SqlLogInfo(sql=e.sql) for e in data]
+        result_list = [SqlLogInfo(sql=sql) for sql in data]
         return Result.ok(BaseResultModel(total=total, data=result_list))
     except Exception as e:
         logger.error(f"{router.prefix}/get_sql_log 调用错误", "WebUi", e=e)
@@ -1,8 +1,10 @@
 from collections.abc import Callable
 import copy
 from datetime import datetime
+from functools import cache
 from pathlib import Path
-from typing import Any, Literal
+import sys
+from typing import Any, Literal, get_args, get_origin
 
 import cattrs
 from nonebot.compat import model_dump
@@ -18,6 +20,83 @@ _yaml = YAML(pure=True)
 _yaml.indent = 2
 _yaml.allow_unicode = True
 
+_SCALAR_TYPES = frozenset((bool, int, float, str))
+"""值已是该类型时可直接返回的标量类型"""
+
+
+@cache
+def _scalar_list_item(type_: Any) -> type | None:
+    """获取 list[标量] 类型的元素类型
+
+    参数:
+        type_: 参数类型
+
+    返回:
+        type | None: 元素类型，非 list[标量] 时为 None
+    """
+    if get_origin(type_) is list:
+        args = get_args(type_)
+        if len(args) == 1 and args[0] in _SCALAR_TYPES:
+            return args[0]
+    return None
+
+
+@cache
+def _scalar_dict_items(type_: Any) -> tuple[type, type] | None:
+    """获取 dict[标量, 标量] 类型的键值类型
+
+    参数:
+        type_: 参数类型
+
+    返回:
+        tuple[type, type] | None: 键类型, 值类型，非 dict[标量, 标量] 时为 None
+    """
+    if get_origin(type_) is dict:
+        args = get_args(type_)
+        if len(args) == 2 and all(arg in _SCALAR_TYPES for arg in args):
+            return args
+    return None
+
+
+def _structure(value: Any, type_: Any) -> Any:
+    """将配置值转换为指定类型
+
+    值已是目标标量类型或元素均为目标标量的列表/字典时直接返回，跳过 cattrs 的转换流程
+
+    参数:
+        value: 配置值
+        type_: 参数类型
+
+    返回:
+        Any: 转换后的值
+    """
+    if not type_:
+        return value
+    value_type = type(value)
+    if value_type is type_ and type_ in _SCALAR_TYPES:
+        return value
+    if value_type is list and (item_type := _scalar_list_item(type_)):
+        if all(type(v) is item_type for v in value):
+            return list(value)
+    if value_type is dict and (item_types := _scalar_dict_items(type_)):
+        key_type, val_type = item_types
+        if all(type(k) is key_type and type(v) is val_type for k, v in value.items()):
+            return dict(value)
+    return cattrs.structure(value, type_)
+
+
+@cache
+def _normalize_key(key: str) -> str:
+    """将配置键统一转换为大写，结果按键缓存
+
+    参数:
+        key: 配置键
+
+    返回:
+        str: 大写配置键
+    """
+    return sys.intern(key.upper())
+
 
 class Example(BaseModel):
     """
@@ -99,7 +178,7 @@ class ConfigGroup(BaseModel):
     """配置项列表"""
 
     def get(self, c: str, default: Any = None) -> Any:
-        cfg = self.configs.get(c.upper())
+        cfg = self.configs.get(_normalize_key(c))
         if cfg is not None:
             if cfg.value is not None:
                 return cfg.value
@@ -367,6 +446,7 @@ class ConfigsManager:
         if not module or not key:
             raise ValueError("add_plugin_config: module和key不能为为空")
         self.add_module.append(f"{module}:{key}".lower())
+        key = _normalize_key(key)
         if module in self._data and (config := self._data[module].configs.get(key)):
             config.help = help
             config.arg_parser = arg_parser
@@ -375,7 +455,6 @@ class ConfigsManager:
                 config.value = value
                 config.default_value = default_value
         else:
-            key = key.upper()
             if not self._data.get(module):
                 self._data[module] = ConfigGroup(module=module)
             self._data[module].configs[key] = ConfigModel(
@@ -400,10 +479,10 @@ class ConfigsManager:
             value: 值
             auto_save: 自动保存.
         """
-        key = key.upper()
-        if module in self._data:
-            if self._data[module].configs.get(key):
-                self._data[module].configs[key].value = value
+        key = _normalize_key(key)
+        if config_group := self._data.get(module):
+            if config := config_group.configs.get(key):
+                config.value = value
             else:
                 self.add_plugin_config(module, key, value)
             self._simple_data[module][key] = value
@@ -424,15 +503,10 @@ class ConfigsManager:
         返回:
             Any: 配置值
         """
-        logger.debug(
-            f"尝试获取配置MODULE: [<u><y>{module}</y></u>] | KEY: [<u><y>{key}</y></u>]"
-        )
-        key = key.upper()
+        key = _normalize_key(key)
         value = None
-        if module in self._data.keys():
-            config = self._data[module].configs.get(key) or self._data[
-                module
-            ].configs.get(key)
+        if config_group := self._data.get(module):
+            config = config_group.configs.get(key)
             if not config:
                 raise NoSuchConfig(
                     f"未查询到配置项 MODULE: [ {module} ] | KEY: [ {key} ]"
@@ -441,18 +515,9 @@ class ConfigsManager:
                 if config.arg_parser:
                     value = config.arg_parser(value or config.default_value)
                 elif config.value is not None:
-                    # try:
-                    value = (
-                        cattrs.structure(config.value, config.type)
-                        if config.type
-                        else config.value
-                    )
+                    value = _structure(config.value, config.type)
                 elif config.default_value is not None:
-                    value = (
-                        cattrs.structure(config.default_value, config.type)
-                        if config.type
-                        else config.default_value
-                    )
+                    value = _structure(config.default_value, config.type)
             except Exception as e:
                 logger.debug(
                     f"配置项类型转换 MODULE: [<u><y>{module}</y></u>]"
@@ -463,8 +528,7 @@ class ConfigsManager:
         if value is None:
             value = default
         logger.debug(
-            f"获取配置 MODULE: [<u><y>{module}</y></u>] | "
-            f" KEY: [<u><y>{key}</y></u>] -> [<u><c>{value}</c></u>]"
+            f"获取配置 MODULE: [<u><y>{module}</y></u>] | KEY: [<u><y>{key}</y></u>]"
         )
         return value
 
@@ -60,15 +60,12 @@ class BagUser(Model):
         """
         user, _ = await cls.get_or_create(user_id=user_id, group_id=group_id)
         if only_active and user.property:
-            data = {}
-            name_list = [
-                x.goods_name
-                for x in await GoodsInfo.get_all_goods()
-                if not x.is_passive
-            ]
-            for key in [x for x in user.property if x in name_list]:
-                data[key] = user.property[key]
-            return data
+            active_names = set(
+                await GoodsInfo.filter(
+                    goods_name__in=list(user.property), is_passive=False
+                ).values_list("goods_name", flat=True)
+            )
+            return {k: v for k, v in user.property.items() if k in active_names}
         return user.property
 
     @classmethod
@@ -1,4 +1,5 @@
 import time
+from typing import Any
 from typing_extensions import Self
 
 from tortoise import fields
@@ -29,8 +30,8 @@ class BanConsole(Model):
         table_description = "封禁人员/群组数据表"
 
     @classmethod
-    async def _get_data(cls, user_id: str | None, group_id: str | None) -> Self | None:
-        """获取数据
+    def _get_filter(cls, user_id: str | None, group_id: str | None) -> dict[str, Any]:
+        """获取查询条件
 
         参数:
             user_id: 用户id
@@ -40,18 +41,31 @@ class BanConsole(Model):
             UserAndGroupIsNone: 用户id和群组id都为空
 
         返回:
-            Self | None: Self
+            dict[str, Any]: 查询条件
         """
         if not user_id and not group_id:
             raise UserAndGroupIsNone()
         if user_id:
-            return (
-                await cls.get_or_none(user_id=user_id, group_id=group_id)
-                if group_id
-                else await cls.get_or_none(user_id=user_id, group_id__isnull=True)
-            )
-        else:
-            return await cls.get_or_none(user_id="", group_id=group_id)
+            if group_id:
+                return {"user_id": user_id, "group_id": group_id}
+            return {"user_id": user_id, "group_id__isnull": True}
+        return {"user_id": "", "group_id": group_id}
+
+    @classmethod
+    async def _get_data(cls, user_id: str | None, group_id: str | None) -> Self | None:
+        """获取数据
+
+        参数:
+            user_id: 用户id
+            group_id: 群组id
+
+        异常:
+            UserAndGroupIsNone: 用户id和群组id都为空
+
+        返回:
+            Self | None: Self
+        """
+        return await cls.get_or_none(**cls._get_filter(user_id, group_id))
 
     @classmethod
     async def check_ban_level(
@@ -138,9 +152,7 @@ class BanConsole(Model):
             f"封禁用户/群组，等级:{ban_level}，时长: {duration}",
             target=f"{group_id}:{user_id}",
         )
-        target = await cls._get_data(user_id, group_id)
-        if target:
-            await cls.unban(user_id, group_id)
+        await cls.unban(user_id, group_id)
         await cls.create(
             user_id=user_id,
             group_id=group_id,
@@ -161,9 +173,7 @@ class BanConsole(Model):
         返回:
             bool: 是否被ban
         """
-        user = await cls._get_data(user_id, group_id)
-        if user:
+        if await cls.filter(**cls._get_filter(user_id, group_id)).delete():
             logger.debug("解除封禁", target=f"{group_id}:{user_id}")
-            await user.delete()
             return True
         return False
@@ -56,8 +56,10 @@ class BotConsole(Model):
         """
         if not bot_id:
             return await cls.all().values_list("bot_id", "status")
-        result = await cls.get_or_none(bot_id=bot_id)
-        return result.status if result else False
+        status = (
+            await cls.filter(bot_id=bot_id).first().values_list("status", flat=True)
+        )
+        return bool(status)
 
     @overload
     @classmethod
@@ -3,6 +3,7 @@ from typing_extensions import Self
 
 from tortoise import fields
 from tortoise.backends.base.client import BaseDBAsyncClient
+from tortoise.expressions import Q
 
 from zhenxun.models.plugin_info import PluginInfo
 from zhenxun.models.task_info import TaskInfo
@@ -120,7 +121,10 @@ class GroupConsole(Model):
     async def create(
         cls, using_db: BaseDBAsyncClient | None = None, **kwargs: Any
     ) -> Self:
-        """覆盖create方法"""
+        """覆盖create方法
+
+        get_or_create 与 update_or_create 创建数据时同样经过此方法
+        """
         group = await super().create(using_db=using_db, **kwargs)
 
         task_modules = await cls._get_task_modules(default_status=False)
@@ -160,50 +164,6 @@ class GroupConsole(Model):
         if update_fields:
             await group.save(using_db=using_db, update_fields=update_fields)
 
-    @classmethod
-    async def get_or_create(
-        cls,
-        defaults: dict | None = None,
-        using_db: BaseDBAsyncClient | None = None,
-        **kwargs: Any,
-    ) -> tuple[Self, bool]:
-        """覆盖get_or_create方法"""
-        group, is_create = await super().get_or_create(
-            defaults=defaults, using_db=using_db, **kwargs
-        )
-        if not is_create:
-            return group, is_create
-
-        task_modules = await cls._get_task_modules(default_status=False)
-        plugin_modules = await cls._get_plugin_modules(default_status=False)
-
-        if task_modules or plugin_modules:
-            await cls._update_modules(group, task_modules, plugin_modules, using_db)
-
-        return group, is_create
-
-    @classmethod
-    async def update_or_create(
-        cls,
-        defaults: dict | None = None,
-        using_db: BaseDBAsyncClient | None = None,
-        **kwargs: Any,
-    ) -> tuple[Self, bool]:
-        """覆盖update_or_create方法"""
-        group, is_create = await super().update_or_create(
-            defaults=defaults, using_db=using_db, **kwargs
-        )
-        if not is_create:
-            return group, is_create
-
-        task_modules = await cls._get_task_modules(default_status=False)
-        plugin_modules = await cls._get_plugin_modules(default_status=False)
-
-        if task_modules or plugin_modules:
-            await cls._update_modules(group, task_modules, plugin_modules, using_db)
-
-        return group, is_create
-
     @classmethod
     async def get_group(
         cls, group_id: str, channel_id: str | None = None
@@ -231,7 +191,9 @@ class GroupConsole(Model):
         返回:
             bool: 是否超级用户指定群
         """
-        return group.is_super if (group := await cls.get_group(group_id)) else False
+        return await cls.exists(
+            group_id=group_id, channel_id__isnull=True, is_super=True
+        )
 
     @classmethod
     async def is_superuser_block_plugin(cls, group_id: str, module: str) -> bool:
@@ -261,11 +223,11 @@ class GroupConsole(Model):
             bool: 是否禁用插件
         """
         module = add_disable_marker(module)
-        return await cls.exists(
-            group_id=group_id, block_plugin__contains=module
-        ) or await cls.exists(
-            group_id=group_id, superuser_block_plugin__contains=module
-        )
+        return await cls.filter(
+            Q(block_plugin__contains=module)
+            | Q(superuser_block_plugin__contains=module),
+            group_id=group_id,
+        ).exists()
 
     @classmethod
     async def set_block_plugin(
@@ -287,18 +249,13 @@ class GroupConsole(Model):
             group_id=group_id, defaults={"platform": platform}
         )
         update_fields = []
+        marker = add_disable_marker(module)
         if is_superuser:
-            superuser_block_plugin = convert_module_format(group.superuser_block_plugin)
-            if module not in superuser_block_plugin:
-                superuser_block_plugin.append(module)
-                group.superuser_block_plugin = convert_module_format(
-                    superuser_block_plugin
-                )
+            if marker not in group.superuser_block_plugin:
+                group.superuser_block_plugin += marker
                 update_fields.append("superuser_block_plugin")
-        elif add_disable_marker(module) not in group.block_plugin:
-            block_plugin = convert_module_format(group.block_plugin)
-            block_plugin.append(module)
-            group.block_plugin = convert_module_format(block_plugin)
+        elif marker not in group.block_plugin:
+            group.block_plugin += marker
             update_fields.append("block_plugin")
         if update_fields:
             await group.save(update_fields=update_fields)
@@ -323,18 +280,15 @@ class GroupConsole(Model):
             group_id=group_id, defaults={"platform": platform}
         )
         update_fields = []
+        marker = add_disable_marker(module)
         if is_superuser:
-            superuser_block_plugin = convert_module_format(group.superuser_block_plugin)
-            if module in superuser_block_plugin:
-                superuser_block_plugin.remove(module)
-                group.superuser_block_plugin = convert_module_format(
-                    superuser_block_plugin
+            if marker in group.superuser_block_plugin:
+                group.superuser_block_plugin = group.superuser_block_plugin.replace(
+                    marker, "", 1
                 )
                 update_fields.append("superuser_block_plugin")
-        elif add_disable_marker(module) in group.block_plugin:
-            block_plugin = convert_module_format(group.block_plugin)
-            block_plugin.remove(module)
-            group.block_plugin = convert_module_format(block_plugin)
+        elif marker in group.block_plugin:
+            group.block_plugin = group.block_plugin.replace(marker, "", 1)
             update_fields.append("block_plugin")
         if update_fields:
             await group.save(update_fields=update_fields)
@@ -391,22 +345,16 @@ class GroupConsole(Model):
         """
         task = add_disable_marker(task)
         if not channel_id:
-            return await cls.exists(
+            return await cls.filter(
+                Q(block_task__contains=task) | Q(superuser_block_task__contains=task),
                 group_id=group_id,
                 channel_id__isnull=True,
-                block_task__contains=task,
-            ) or await cls.exists(
-                group_id=group_id,
-                channel_id__isnull=True,
-                superuser_block_task__contains=task,
-            )
-        return await cls.exists(
-            group_id=group_id, channel_id=channel_id, block_task__contains=task
-        ) or await cls.exists(
+            ).exists()
+        return await cls.filter(
+            Q(channel_id=channel_id, block_task__contains=task)
+            | Q(channel_id__isnull=True, superuser_block_task__contains=task),
             group_id=group_id,
-            channel_id__isnull=True,
-            superuser_block_task__contains=task,
-        )
+        ).exists()
 
     @classmethod
     async def set_block_task(
@@ -428,16 +376,13 @@ class GroupConsole(Model):
             group_id=group_id, defaults={"platform": platform}
         )
         update_fields = []
+        marker = add_disable_marker(task)
         if is_superuser:
-            superuser_block_task = convert_module_format(group.superuser_block_task)
-            if task not in group.superuser_block_task:
-                superuser_block_task.append(task)
-                group.superuser_block_task = convert_module_format(superuser_block_task)
+            if marker not in group.superuser_block_task:
+                group.superuser_block_task += marker
                 update_fields.append("superuser_block_task")
-        elif add_disable_marker(task) not in group.block_task:
-            block_task = convert_module_format(group.block_task)
-            block_task.append(task)
-            group.block_task = convert_module_format(block_task)
+        elif marker not in group.block_task:
+            group.block_task += marker
             update_fields.append("block_task")
         if update_fields:
             await group.save(update_fields=update_fields)
@@ -462,16 +407,15 @@ class GroupConsole(Model):
             group_id=group_id, defaults={"platform": platform}
         )
         update_fields = []
+        marker = add_disable_marker(task)
         if is_superuser:
-            superuser_block_task = convert_module_format(group.superuser_block_task)
-            if task in superuser_block_task:
-                superuser_block_task.remove(task)
-                group.superuser_block_task = convert_module_format(superuser_block_task)
+            if marker in group.superuser_block_task:
+                group.superuser_block_task = group.superuser_block_task.replace(
+                    marker, "", 1
+                )
                 update_fields.append("superuser_block_task")
-        elif add_disable_marker(task) in group.block_task:
-            block_task = convert_module_format(group.block_task)
-            block_task.remove(task)
-            group.block_task = convert_module_format(block_task)
+        elif marker in group.block_task:
+            group.block_task = group.block_task.replace(marker, "", 1)
             update_fields.append("block_task")
         if update_fields:
             await group.save(update_fields=update_fields)
@@ -33,9 +33,12 @@ class LevelUser(Model):
         """
         if not group_id:
             return 0
-        if user := await cls.get_or_none(user_id=user_id, group_id=group_id):
-            return user.user_level
-        return 0
+        level = (
+            await cls.filter(user_id=user_id, group_id=group_id)
+            .first()
+            .values_list("user_level", flat=True)
+        )
+        return level or 0
 
     @classmethod
     async def set_level(
@@ -91,13 +94,10 @@ class LevelUser(Model):
             bool: 是否大于level
         """
         if group_id:
-            if user := await cls.get_or_none(user_id=user_id, group_id=group_id):
-                return user.user_level >= level
-        else:
-            if user_list := await cls.filter(user_id=user_id).all():
-                user = max(user_list, key=lambda x: x.user_level)
-                return user.user_level >= level
-        return False
+            return await cls.exists(
+                user_id=user_id, group_id=group_id, user_level__gte=level
+            )
+        return await cls.exists(user_id=user_id, user_level__gte=level)
 
     @classmethod
     async def is_group_flag(cls, user_id: str, group_id: str) -> bool:
@@ -110,9 +110,7 @@ class LevelUser(Model):
         返回:
             bool: 是否会被自动更新权限刷新
         """
-        if user := await cls.get_or_none(user_id=user_id, group_id=group_id):
-            return user.group_flag == 1
-        return False
+        return await cls.exists(user_id=user_id, group_id=group_id, group_flag=1)
 
     @classmethod
     async def _run_script(cls):
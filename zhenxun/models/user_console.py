@@ -41,15 +41,11 @@ class UserConsole(Model):
         返回:
             UserConsole: UserConsole
         """
-        if not await cls.exists(user_id=user_id):
-            await cls.create(
-                user_id=user_id, platform=platform, uid=await cls.get_new_uid()
-            )
-        # user, _ = await UserConsole.get_or_create(
-        #     user_id=user_id,
-        #     defaults={"platform": platform, "uid": await cls.get_new_uid()},
-        # )
-        return await cls.get(user_id=user_id)
+        if user := await cls.get_or_none(user_id=user_id):
+            return user
+        return await cls.create(
+            user_id=user_id, platform=platform, uid=await cls.get_new_uid()
+        )
 
     @classmethod
     async def get_new_uid(cls) -> int:
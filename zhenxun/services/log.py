@@ -16,6 +16,15 @@ driver = nonebot.get_driver()
 
 log_level = driver.config.log_level or "INFO"
 
+log_level_no = logger_.level(log_level).no if isinstance(log_level, str) else log_level
+
+_FILTERED_LEVELS = frozenset(
+    name.lower()
+    for name in ("TRACE", "DEBUG", "INFO", "SUCCESS", "WARNING", "ERROR", "CRITICAL")
+    if logger_.level(name).no < log_level_no
+)
+"""低于当前日志等级的级别，记录时直接跳过"""
+
 logger_.add(
     LOG_PATH / "{time:YYYY-MM-DD}.log",
     level=log_level,
@@ -95,6 +104,8 @@ class logger:
         """
         核心日志处理方法，处理所有日志级别的通用逻辑。
         """
+        if level in _FILTERED_LEVELS:
+            return
         user_id: str | None = str(session) if isinstance(session, int | str) else None
 
         if isinstance(session, Session):
@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
 from collections.abc import Callable
+from typing import Literal
 
 import nonebot
 from nonebot.utils import is_coroutine_callable
@@ -51,54 +52,43 @@ class PluginInitData(BaseModel):
 class PluginInitManager:
     plugins: dict[str, PluginInitData] = {}  # noqa: RUF012
 
+    @classmethod
+    async def __run(cls, module_path: str, method: Literal["install", "remove"]):
+        """运行指定插件的安装或卸载方法
+
+        参数:
+            module_path: 模块名
+            method: 方法名
+        """
+        model = cls.plugins.get(module_path)
+        if not model or not getattr(model, method):
+            return
+        func = getattr(model.class_(), method)
+        try:
+            logger.debug(f"开始执行: {module_path}:{method} 方法")
+            if is_coroutine_callable(func):
+                await func()
+            else:
+                func()
+            logger.debug(f"执行: {module_path}:{method} 完成")
+        except Exception as e:
+            logger.error(f"执行: {module_path}:{method} 失败", e=e)
+
     @classmethod
     async def install_all(cls):
         """运行所有插件安装方法"""
-        if cls.plugins:
-            for module_path, model in cls.plugins.items():
-                if model.install:
-                    class_ = model.class_()
-                    try:
-                        logger.debug(f"开始执行: {module_path}:install 方法")
-                        if is_coroutine_callable(class_.install):
-                            await class_.install()
-                        else:
-                            class_.install()  # type: ignore
-                            logger.debug(f"执行: {module_path}:install 完成")
-                    except Exception as e:
-                        logger.error(f"执行: {module_path}:install 失败", e=e)
+        for module_path in cls.plugins:
+            await cls.__run(module_path, "install")
 
     @classmethod
     async def install(cls, module_path: str):
         """运行指定插件安装方法"""
-        if model := cls.plugins.get(module_path):
-            if model.install:
-                class_ = model.class_()
-                try:
-                    logger.debug(f"开始执行: {module_path}:install 方法")
-                    if is_coroutine_callable(class_.install):
-                        await class_.install()
-                    else:
-                        class_.install()  # type: ignore
-                        logger.debug(f"执行: {module_path}:install 完成")
-                except Exception as e:
-                    logger.error(f"执行: {module_path}:install 失败", e=e)
+        await cls.__run(module_path, "install")
 
     @classmethod
     async def remove(cls, module_path: str):
-        """运行指定插件安装方法"""
-        if model := cls.plugins.get(module_path):
-            if model.remove:
-                class_ = model.class_()
-                try:
-                    logger.debug(f"开始执行: {module_path}:remove 方法")
-                    if is_coroutine_callable(class_.remove):
-                        await class_.remove()
-                    else:
-                        class_.remove()  # type: ignore
-                        logger.debug(f"执行: {module_path}:remove 完成")
-                except Exception as e:
-                    logger.error(f"执行: {module_path}:remove 失败", e=e)
+        """运行指定插件卸载方法"""
+        await cls.__run(module_path, "remove")
 
 
 @PriorityLifecycle.on_startup(priority=5)
@@ -86,21 +86,27 @@ class UserBlockLimiter:
     检测用户是否正在调用命令
     """
 
+    TIMEOUT = 30
+    """调用状态超时时间（秒），超时后自动解除"""
+
     def __init__(self):
-        self.flag_data = defaultdict(bool)
-        self.time = time.time()
+        self.flag_data: dict[Any, float] = {}
+        """正在调用的对象与开始时间"""
 
     def set_true(self, key: Any):
-        self.time = time.time()
-        self.flag_data[key] = True
+        self.flag_data[key] = time.time()
 
     def set_false(self, key: Any):
-        self.flag_data[key] = False
+        self.flag_data.pop(key, None)
 
     def check(self, key: Any) -> bool:
-        if time.time() - self.time > 30:
+        start_time = self.flag_data.get(key)
+        if start_time is None:
+            return True
+        if time.time() - start_time > self.TIMEOUT:
             self.set_false(key)
-        return not self.flag_data[key]
+            return True
+        return False
 
 
 class FreqLimiter:
@@ -108,20 +114,34 @@ class FreqLimiter:
     命令冷却，检测用户是否处于冷却状态
     """
 
+    SWEEP_INTERVAL = 60
+    """清理过期冷却记录的最小间隔（秒）"""
+
     def __init__(self, default_cd_seconds: int):
-        self.next_time = defaultdict(float)
+        self.next_time: dict[Any, float] = {}
         self.default_cd = default_cd_seconds
+        self._next_sweep = 0.0
 
     def check(self, key: Any) -> bool:
-        return time.time() >= self.next_time[key]
+        return time.time() >= self.next_time.get(key, 0)
 
     def start_cd(self, key: Any, cd_time: int = 0):
-        self.next_time[key] = time.time() + (
-            cd_time if cd_time > 0 else self.default_cd
-        )
+        now = time.time()
+        if now >= self._next_sweep:
+            self.__sweep(now)
+        self.next_time[key] = now + (cd_time if cd_time > 0 else self.default_cd)
 
     def left_time(self, key: Any) -> float:
-        return self.next_time[key] - time.time()
+        return self.next_time.get(key, 0) - time.time()
+
+    def __sweep(self, now: float):
+        """批量清理已结束冷却的记录，避免记录随用户数无限增长
+
+        参数:
+            now: 当前时间戳
+        """
+        self.next_time = {k: v for k, v in self.next_time.items() if v > now}
+        self._next_sweep = now + max(self.default_cd, self.SWEEP_INTERVAL)
 
 
 def cn2py(word: str) -> str: